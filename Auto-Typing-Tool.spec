@@ -0,0 +1,88 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for Auto Typing Tool.
+
+Lists the app's modules and exclusions explicitly so PyInstaller doesn't have to
+rediscover them on every build. Used by build.py; to run it directly:
+
+    pyinstaller --noconfirm Auto-Typing-Tool.spec -- --mode onefile
+"""
+
+import argparse
+import sys
+
+from PyInstaller import __version__ as PYINSTALLER_VERSION
+
+MIN_PYINSTALLER_VERSION = (6, 6)  # First release with Analysis(optimize=...)
+if tuple(int(part) for part in PYINSTALLER_VERSION.split(".")[:2]) < MIN_PYINSTALLER_VERSION:
+    sys.exit(
+        f"PyInstaller {'.'.join(map(str, MIN_PYINSTALLER_VERSION))} or later is required "
+        f"(found {PYINSTALLER_VERSION}); upgrade with: pip install --upgrade pyinstaller"
+    )
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--mode", choices=["onedir", "onefile"], default="onedir")
+parser.add_argument("--upx", action="store_true")
+options = parser.parse_args()
+
+APP_NAME = "Auto-Typing-Tool"
+HIDDEN_IMPORTS = [
+    "pattern_matcher",
+    "pause_directive",
+    "help_window",
+    "code_patterns",
+    "typing_schedule",
+]
+# Stdlib and third-party modules the app never imports; PyInstaller would
+# otherwise bundle them if they show up anywhere in the import graph
+EXCLUDED_MODULES = [
+    "tkinter.test",
+    "unittest",
+    "test",
+    "pydoc_data",
+    "distutils",
+    "numpy",
+    "pandas",
+    "email.test",
+]
+BYTECODE_OPTIMIZE_LEVEL = 1  # Same as python -O: strips asserts
+STRIP_BINARIES = sys.platform.startswith("linux")  # Stripping breaks macOS/Windows signing
+
+a = Analysis(
+    ["src/main.py"],
+    pathex=["src"],
+    binaries=[],
+    datas=[],
+    hiddenimports=HIDDEN_IMPORTS,
+    excludes=EXCLUDED_MODULES,
+    optimize=BYTECODE_OPTIMIZE_LEVEL,
+)
+pyz = PYZ(a.pure)
+
+if options.mode == "onefile":
+    exe = EXE(
+        pyz, a.scripts, a.binaries, a.datas, [],
+        name=APP_NAME,
+        console=False,
+        strip=STRIP_BINARIES,
+        upx=options.upx,
+    )
+    bundle_target = exe
+else:
+    exe = EXE(
+        pyz, a.scripts, [],
+        exclude_binaries=True,
+        name=APP_NAME,
+        console=False,
+        strip=STRIP_BINARIES,
+        upx=options.upx,
+    )
+    bundle_target = COLLECT(
+        exe, a.binaries, a.datas,
+        name=APP_NAME,
+        strip=STRIP_BINARIES,
+        upx=options.upx,
+    )
+
+if sys.platform == "darwin":
+    app = BUNDLE(bundle_target, name=f"{APP_NAME}.app")
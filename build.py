@@ -4,13 +4,27 @@ Simple build script for Auto Typing Tool
 Creates a standalone executable using PyInstaller
 """
 
+import argparse
 import subprocess
+from collections import deque
+import shutil
 import sys
 import os
-from pathlib import Path
 
-def build_app():
-    """Build the Auto Typing Tool executable."""
+BUILD_MODES = ["onedir", "onefile"]
+DEFAULT_BUILD_MODE = "onedir"  # Launches faster; onefile unpacks itself on every launch
+SPEC_FILE = "Auto-Typing-Tool.spec"  # Bundled modules, exclusions and options live here
+ERROR_LOG_TAIL_LINES = 50  # PyInstaller log lines shown when the build fails
+
+def build_app(mode=DEFAULT_BUILD_MODE, use_upx=False):
+    """Build the Auto Typing Tool executable.
+    
+    Args:
+        mode: PyInstaller bundle mode, "onedir" or "onefile"
+        use_upx: Compress bundled binaries with UPX if it is installed
+    """
+    from pathlib import Path  # Only needed when building
+    
     print("🔨 Building Auto Typing Tool...")
     
     # Check if we're in the right directory
@@ -31,31 +45,17 @@ def build_app():
         # Clean previous builds
         print("🧹 Cleaning previous builds...")
         for folder in ["build", "dist"]:
-            if os.path.exists(folder):
-                subprocess.run(["rm", "-rf", folder], check=False)
+            shutil.rmtree(folder, ignore_errors=True)
         
-        # Remove old spec file
-        spec_files = [f for f in os.listdir(".") if f.endswith(".spec")]
-        for spec_file in spec_files:
-            os.remove(spec_file)
-            print(f"🗑️  Removed old spec file: {spec_file}")
+        upx_path = shutil.which("upx") if use_upx else None
+        if use_upx and not upx_path:
+            print("⚠️  UPX not found, building without compression")
         
-        # Run PyInstaller command
-        cmd = [
-            pyinstaller_cmd,
-            "--onedir",
-            "--windowed", 
-            "--name", "Auto-Typing-Tool",
-            "--paths=src",
-            "--hidden-import=pattern_matcher",
-            "--hidden-import=pause_directive",
-            "--hidden-import=help_window",
-            "--hidden-import=code_patterns",
-            "src/main.py"
-        ]
+        print(f"📄 Using spec file: {SPEC_FILE}")
+        cmd = spec_build_command(pyinstaller_cmd, mode, upx_path)
         
         print(f"⚡ Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        warnings = run_build(cmd)
         
         print("✅ Build completed successfully!")
         
@@ -70,11 +70,10 @@ def build_app():
             print("⚠️  Executable not found in expected location")
             
         # Show any warnings from PyInstaller
-        if result.stderr and "WARNING" in result.stderr:
+        if warnings:
             print("\n📋 Build warnings:")
-            for line in result.stderr.split('\n'):
-                if "WARNING" in line:
-                    print(f"  ⚠️  {line.strip()}")
+            for line in warnings:
+                print(f"  ⚠️  {line}")
         
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed with exit code {e.returncode}")
@@ -98,8 +97,57 @@ def build_app():
         print("\n🛑 Build cancelled by user")
         sys.exit(1)
 
+def run_build(cmd):
+    """Run PyInstaller, streaming its log instead of buffering all of it.
+    
+    Only warning lines and the tail of the log (for error reports) are kept.
+    
+    Returns:
+        list: Warning lines from the PyInstaller log
+        
+    Raises:
+        subprocess.CalledProcessError: If PyInstaller fails; stderr holds the log tail
+    """
+    warnings = []
+    log_tail = deque(maxlen=ERROR_LOG_TAIL_LINES)
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stderr:
+            if "WARNING" in line:
+                warnings.append(line.strip())
+            log_tail.append(line)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr="".join(log_tail))
+    return warnings
+
+def spec_build_command(pyinstaller_cmd, mode, upx_path):
+    """Build the PyInstaller command that runs the checked-in spec file."""
+    cmd = [pyinstaller_cmd, "--noconfirm"]
+    if upx_path:
+        cmd += ["--upx-dir", os.path.dirname(upx_path)]
+    cmd += [SPEC_FILE, "--", "--mode", mode]
+    if upx_path:
+        cmd.append("--upx")
+    return cmd
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Build the Auto Typing Tool with PyInstaller")
+    parser.add_argument(
+        "--mode", choices=BUILD_MODES, default=DEFAULT_BUILD_MODE,
+        help="onedir launches faster, onefile produces a single smaller file "
+             f"(default: {DEFAULT_BUILD_MODE})"
+    )
+    parser.add_argument(
+        "--upx", action="store_true",
+        help="compress bundled binaries with UPX if it is installed"
+    )
+    return parser.parse_args()
+
 def main():
     """Main entry point."""
+    args = parse_args()
+    
     print("=" * 50)
     print("  AUTO TYPING TOOL - BUILD SCRIPT")
     print("=" * 50)
@@ -108,7 +156,7 @@ def main():
     print(f"📁 Working directory: {os.getcwd()}")
     
     # Check for required files
-    required_files = ["src/main.py"]
+    required_files = ["src/main.py", SPEC_FILE]
     print(f"📁 required files: {required_files}")
     missing_files = [f for f in required_files if not os.path.exists(f)]
     
@@ -116,7 +164,7 @@ def main():
         print(f"❌ Missing required files: {', '.join(missing_files)}")
         sys.exit(1)
     
-    build_app()
+    build_app(args.mode, args.upx)
     
     print("\n" + "=" * 50)
     print("🎉 Build process completed!")
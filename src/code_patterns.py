@@ -9,6 +9,8 @@ import re
 class CodePattern:
     """Represents a code pattern with associated typing behavior."""
     
+    __slots__ = ('pattern_type', 'speed_multiplier', 'pause_before', 'pause_after')
+    
     def __init__(self, pattern_type, speed_multiplier, pause_before=0, pause_after=0):
         self.pattern_type = pattern_type  # 'keyword', 'boilerplate', 'custom', etc.
         self.speed_multiplier = speed_multiplier  # Multiplier for base WPM
@@ -4,8 +4,9 @@ Help window for Auto Typing Tool.
 Provides platform-specific help and setup instructions.
 """
 
-import platform
-from tkinter import messagebox
+import tkinter as tk
+from functools import lru_cache
+from tkinter import scrolledtext
 
 
 # Help text sections
@@ -75,15 +76,43 @@ class HelpWindow:
     """Help window displaying setup instructions and feature documentation."""
     
     TITLE = "Auto Typing Tool - Help"
+    TEXT_WIDTH = 80
+    TEXT_HEIGHT = 30
+    
+    _window = None  # Created on first open, then hidden and shown again
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_help_text() -> str:
-        """Get platform-appropriate help text."""
+        """Get platform-appropriate help text, detecting the platform on first use."""
+        import platform  # Only needed once the help is opened, not at startup
         if platform.system() == "Darwin":
             return _MACOS_HELP
         return _OTHER_PLATFORM_HELP
     
     @classmethod
     def open(cls) -> None:
-        """Open the help dialog."""
-        messagebox.showinfo(cls.TITLE, cls._get_help_text())
+        """Open the help window, or bring it back to the front if already created."""
+        if cls._window is not None and cls._window.winfo_exists():
+            cls._window.deiconify()
+            cls._window.lift()
+            cls._window.focus_set()
+            return
+        cls._window = cls._create_window()
+    
+    @classmethod
+    def _create_window(cls) -> tk.Toplevel:
+        """Create the help window; closing it hides it so it can be reused."""
+        window = tk.Toplevel()
+        window.title(cls.TITLE)
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        
+        help_text = scrolledtext.ScrolledText(
+            window, wrap=tk.WORD, width=cls.TEXT_WIDTH, height=cls.TEXT_HEIGHT
+        )
+        help_text.insert("1.0", cls._get_help_text())
+        help_text.config(state=tk.DISABLED)  # Read-only
+        help_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        
+        tk.Button(window, text="Close", command=window.withdraw).pack(pady=(0, 10))
+        return window
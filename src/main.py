@@ -1,8 +1,6 @@
 import tkinter as tk
 from tkinter import scrolledtext
-from pynput.keyboard import Controller
 import threading
-import random
 import time
 import logging
 import tempfile
@@ -10,25 +8,29 @@ import os
 from pattern_matcher import PatternMatcher
 from pause_directive import PauseDirectiveParser
 from help_window import HelpWindow
+from typing_schedule import build_schedule, sleep_until
 
 # Constants
 DEFAULT_START_DELAY = 3  # Seconds to wait before starting typing
 DEFAULT_MIN_WPM = 100
 DEFAULT_MAX_WPM = 250
-CHARS_PER_WORD = 5  # Standard typing test assumption
 TEXT_WIDGET_HEIGHT = 15
 LANGUAGE_DROPDOWN_WIDTH = 12
+MS_PER_SECOND = 1000  # Tk's after() takes milliseconds
 
 # Globals
 start_delay = DEFAULT_START_DELAY
-is_typing = False
+typing_halted = threading.Event()  # Set while not typing; set to pause or stop
+typing_halted.set()
 current_position = 0
 min_wpm = DEFAULT_MIN_WPM
 max_wpm = DEFAULT_MAX_WPM
 typing_thread = None
-keyboard = Controller()
+pending_start = None  # Id of the root.after() call that will start typing, see schedule_worker()
+keyboard = None  # Created on first use, see get_keyboard()
 pattern_matcher = PatternMatcher('java')  # Default to Java
 ignore_leading_whitespace = False  # Toggle for ignoring leading whitespace
+batch_patterns = False  # Toggle for typing each pattern and plain run in one keystroke batch
 pause_parser = PauseDirectiveParser()  # Parser for {{PAUSE:X}} directives
 
 # Configure logging
@@ -43,146 +45,138 @@ logging.basicConfig(
 )
 logging.info(f"Log file: {log_file}")
 
-def auto_type(text_widget):
-    """Simulates typing with human-like speed variation based on code patterns."""
-    global is_typing, current_position, min_wpm, max_wpm, pattern_matcher, ignore_leading_whitespace
-    text = text_widget.get("1.0", tk.END).strip()  # Get text from the text widget
+def plan_typing(text):
+    """Plans every keystroke and delay with human-like speed variation based on code patterns.
     
-    logging.info(f"Starting auto-type with min_wpm={min_wpm}, max_wpm={max_wpm}, language={pattern_matcher.language}, ignore_leading_whitespace={ignore_leading_whitespace}")
+    Runs on the GUI thread, so the settings can't change halfway through planning
+    and the typing thread is left with nothing to do but type and wait.
     
-    # Track if we're at the beginning of a line
-    # When resuming, check if we're actually at line start based on current position
-    at_line_start = True
-    if current_position > 0:
-        # Look backwards to find if we're at the start of a line
-        # We're at line start only if the previous character was a newline
-        # or if we're at position 0
-        at_line_start = (text[current_position - 1] == '\n')
+    Args:
+        text: Snapshot of the text widget contents
     
-    while current_position < len(text):
-        if not is_typing:
+    Returns:
+        The typing schedule, starting from the current position
+    """
+    logging.info(f"Starting auto-type with min_wpm={min_wpm}, max_wpm={max_wpm}, language={pattern_matcher.language}, ignore_leading_whitespace={ignore_leading_whitespace}, batch_patterns={batch_patterns}")
+    return build_schedule(
+        text, current_position, pattern_matcher, pause_parser,
+        min_wpm, max_wpm, ignore_leading_whitespace, batch_patterns
+    )
+
+def auto_type(schedule, type_text):
+    """Types a planned schedule on the typing thread.
+    
+    Args:
+        schedule: TypingStep list from plan_typing()
+        type_text: Bound type method of the keyboard controller from get_keyboard()
+    """
+    global current_position
+    
+    # Sleep towards absolute deadlines so sleep overshoot doesn't add up over the text
+    wait = sleep_until
+    is_halted = typing_halted.is_set
+    deadline = time.perf_counter()
+    for step in schedule:
+        if is_halted():
             break
-        
-        # Check for pause directive at current position (highest priority)
-        pause_directive = pause_parser.find_directive_at_position(text, current_position)
-        if pause_directive:
-            logging.info(f"Executing pause directive: {pause_directive.duration}s at position {current_position}")
-            time.sleep(pause_directive.duration)
-            current_position = pause_directive.end_position  # Skip past the directive
-            # After a pause directive, check if we're now at line start
-            if current_position > 0 and current_position < len(text):
-                at_line_start = (text[current_position - 1] == '\n')
-            continue
-        
-        current_char = text[current_position]
-        
-        # Check if we should skip leading whitespace
-        if ignore_leading_whitespace and at_line_start and current_char in ' \t':
-            logging.debug(f"Skipping leading whitespace at position {current_position}")
-            current_position += 1
-            continue
-        
-        # We're going to type this character, so update line start tracking
-        # If we type a non-whitespace char, we're no longer at line start
-        if current_char not in ' \t':
-            at_line_start = False
-        
-        # Check if we're at the start of a known pattern
-        pattern_info = pattern_matcher.find_pattern_at_position(text, current_position)
-        
-        if pattern_info:
-            # Found a pattern - apply pause before if needed
-            if pattern_info['pause_before'] > 0:
-                logging.debug(f"Pause before pattern '{pattern_info['matched_text']}': {pattern_info['pause_before']}s")
-                time.sleep(pattern_info['pause_before'])
-            
-            # Type each character of the pattern with adjusted speed
-            pattern_length = pattern_info['length']
-            base_delay = 60 / (random.uniform(min_wpm, max_wpm) * CHARS_PER_WORD)
-            adjusted_delay = base_delay / pattern_info['speed_multiplier']
-            
-            logging.info(f"Typing pattern '{pattern_info['matched_text']}' (category: {pattern_info['category']}) "
-                        f"with speed_multiplier={pattern_info['speed_multiplier']:.2f}, "
-                        f"delay={adjusted_delay:.4f}s per char")
-            
-            # Type the pattern character by character
-            for i in range(pattern_length):
-                if not is_typing:
-                    break
-                char = text[current_position]
-                keyboard.type(char)
-                
-                # After typing a newline, next position is at line start
-                if char == '\n':
-                    at_line_start = True
-                
-                current_position += 1
-                if i < pattern_length - 1:  # Don't delay after the last character
-                    time.sleep(adjusted_delay)
-            
-            # Apply pause after if needed
-            if pattern_info['pause_after'] > 0:
-                logging.debug(f"Pause after pattern '{pattern_info['matched_text']}': {pattern_info['pause_after']}s")
-                time.sleep(pattern_info['pause_after'])
-        else:
-            # No pattern match - use default speed
-            keyboard.type(current_char)
-            
-            # After typing a newline, next position is at line start
-            if current_char == '\n':
-                at_line_start = True
-            
-            current_position += 1
-            
-            # WPM delay: Convert WPM to delay per character
-            delay = 60 / (random.uniform(min_wpm, max_wpm) * CHARS_PER_WORD)
-            time.sleep(delay)
+        if step.text:
+            type_text(step.text)
+        current_position = step.end_position
+        deadline = wait(deadline + step.delay, typing_halted)
+        if deadline is None:
+            break  # Paused or stopped mid-wait
+
+def get_keyboard():
+    """Return the keyboard controller, creating it on first use.
+    
+    Creating a pynput Controller sets up platform input hooks, so it's deferred
+    until typing actually starts to keep the GUI startup fast. Call it on the Tk
+    thread: on macOS the Controller reads the keyboard layout through APIs that
+    must run on the main thread.
+    """
+    global keyboard
+    if keyboard is None:
+        from pynput.keyboard import Controller
+        keyboard = Controller()
+    return keyboard
 
 def start_typing(text_widget, min_wpm_input, max_wpm_input):
     """Starts the typing process."""
-    global is_typing, typing_thread, min_wpm, max_wpm
-    if is_typing:
+    global min_wpm, max_wpm
+    if not typing_halted.is_set():
         return  # Prevent starting again if already typing
     try:
         min_wpm = int(min_wpm_input.get())
         max_wpm = int(max_wpm_input.get())
         update_status(f"Starting in {start_delay} seconds...")
-        time.sleep(start_delay)  # Delay to allow focusing on another UI
-        is_typing = True
-        if typing_thread is None or not typing_thread.is_alive():  # Start a new thread
-            typing_thread = threading.Thread(
-                target=auto_type, args=(text_widget,), daemon=True
-            )
-            typing_thread.start()
-        update_status("Typing started.")
+        typing_halted.clear()
+        schedule_worker(text_widget, "Typing started.")
     except ValueError:
         update_status("Please enter valid WPM values.")
 
+def schedule_worker(text_widget, status):
+    """Start the typing thread after the start delay, replacing any start already scheduled.
+    
+    The delay allows focusing on another UI, without blocking the GUI.
+    """
+    global pending_start
+    cancel_pending_start()
+    pending_start = root.after(start_delay * MS_PER_SECOND, spawn_worker, text_widget, status)
+
+def cancel_pending_start():
+    """Cancel the scheduled start of the typing thread, if any."""
+    global pending_start
+    if pending_start is not None:
+        root.after_cancel(pending_start)
+        pending_start = None
+
+def spawn_worker(text_widget, status):
+    """Start the typing thread once the start delay is over."""
+    global typing_thread, pending_start
+    pending_start = None
+    if typing_halted.is_set():
+        return  # Paused or stopped during the start delay
+    if typing_thread is None or not typing_thread.is_alive():  # Start a new thread
+        try:
+            type_text = get_keyboard().type
+        except Exception as e:  # pynput missing, or no display to send keystrokes to
+            logging.error(f"Could not create keyboard controller: {e}")
+            typing_halted.set()
+            update_status(f"Keyboard unavailable: {e}")
+            return
+        typing_thread = threading.Thread(
+            target=auto_type, args=(plan_typing(get_text_snapshot(text_widget)), type_text), daemon=True
+        )
+        typing_thread.start()
+    update_status(status)
+
+def get_text_snapshot(text_widget):
+    """Read the text to type from the text widget, once per typing session.
+    
+    Reads up to "end-1c" to leave out the newline Tk always appends, so strip()
+    can usually return the string as-is instead of copying the whole text.
+    """
+    return text_widget.get("1.0", "end-1c").strip()
+
 def pause_typing():
     """Pauses the typing process."""
-    global is_typing
-    if is_typing:
-        is_typing = False
+    if not typing_halted.is_set():
+        typing_halted.set()
+        cancel_pending_start()
         update_status("Typing paused.")
 
 def continue_typing():
     """Continues the typing process."""
-    global is_typing, typing_thread
-    if not is_typing:
+    if typing_halted.is_set():
         update_status(f"Continuing in {start_delay} seconds...")
-        time.sleep(start_delay)  # Delay to allow focusing on another UI
-        is_typing = True
-        if typing_thread is None or not typing_thread.is_alive():  # Resume the thread
-            typing_thread = threading.Thread(
-                target=auto_type, args=(text_widget,), daemon=True
-            )
-            typing_thread.start()
-        update_status("Typing continued.")
+        typing_halted.clear()
+        schedule_worker(text_widget, "Typing continued.")
 
 def stop_typing():
     """Stops the typing process and resets progress."""
-    global is_typing, current_position
-    is_typing = False
+    global current_position
+    typing_halted.set()
+    cancel_pending_start()
     current_position = 0
     update_status("Typing stopped. Progress reset.")
 
@@ -206,6 +200,14 @@ def on_whitespace_toggle():
     status = "enabled" if ignore_leading_whitespace else "disabled"
     update_status(f"Ignore leading whitespace {status}")
 
+def on_batch_toggle():
+    """Handle toggle of the batch keystrokes checkbox."""
+    global batch_patterns
+    batch_patterns = batch_var.get()
+    logging.info(f"Batch keystrokes: {batch_patterns}")
+    status = "enabled" if batch_patterns else "disabled"
+    update_status(f"Batch keystrokes {status}")
+
 # Create the GUI
 root = tk.Tk()
 root.title("Auto Typing Tool")
@@ -215,7 +217,7 @@ root.minsize(600, 400)
 root.columnconfigure(0, weight=1)
 root.rowconfigure(3, weight=1)  # Text area row expands
 
-# Row 0: Language select + ignore whitespace checkbox + help button
+# Row 0: Language select + ignore whitespace and batch checkboxes + help button
 options_frame = tk.Frame(root)
 options_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
 
@@ -249,6 +251,15 @@ whitespace_checkbox = tk.Checkbutton(
 )
 whitespace_checkbox.pack(side=tk.LEFT, padx=(20, 0))
 
+batch_var = tk.BooleanVar(value=False)
+batch_checkbox = tk.Checkbutton(
+    options_frame,
+    text="Batch keystrokes",
+    variable=batch_var,
+    command=on_batch_toggle
+)
+batch_checkbox.pack(side=tk.LEFT, padx=(20, 0))
+
 help_button = tk.Button(
     options_frame, 
     text="ℹ️ Help",
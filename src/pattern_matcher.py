@@ -4,8 +4,215 @@ Detects code patterns in text to apply appropriate typing speed variations.
 """
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
 from code_patterns import LANGUAGE_PATTERNS, OPERATOR_PATTERNS, PUNCTUATION_PATTERNS
 
+# Constants
+LANGUAGE_CACHE_SIZE = 16  # Compiled pattern tables kept, one per language
+
+
+@dataclass(frozen=True)
+class PatternInfo:
+    """A compiled pattern and the typing behavior for it.
+    
+    Attributes:
+        word_boundary: Whether the pattern must match whole words
+        pattern: The literal pattern text
+        speed_multiplier: Typing speed multiplier for the pattern
+        pause_before: Seconds to pause before typing the pattern
+        pause_after: Seconds to pause after typing the pattern
+        category: Name of the pattern's category
+    """
+    
+    __slots__ = ('word_boundary', 'pattern', 'speed_multiplier', 'pause_before', 'pause_after', 'category')
+    
+    word_boundary: bool
+    pattern: str
+    speed_multiplier: float
+    pause_before: float
+    pause_after: float
+    category: str
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """A pattern matched in the text.
+    
+    Attributes:
+        pattern: The literal pattern text
+        matched_text: The text that matched
+        length: Length of the matched text
+        speed_multiplier: Typing speed multiplier for the pattern
+        pause_before: Seconds to pause before typing the pattern
+        pause_after: Seconds to pause after typing the pattern
+        category: Name of the pattern's category
+    """
+    
+    __slots__ = ('pattern', 'matched_text', 'length', 'speed_multiplier', 'pause_before', 'pause_after',
+                 'category')
+    
+    pattern: str
+    matched_text: str
+    length: int
+    speed_multiplier: float
+    pause_before: float
+    pause_after: float
+    category: str
+
+
+@dataclass(frozen=True)
+class CompiledLanguage:
+    """The compiled pattern tables for a language.
+    
+    Attributes:
+        patterns: PatternInfo per pattern, in capture group order
+        match_results: MatchResult per pattern, in the same order
+        regex: Combined alternation regex with one capture group per pattern
+    """
+    
+    __slots__ = ('patterns', 'match_results', 'regex')
+    
+    patterns: tuple
+    match_results: tuple
+    regex: re.Pattern
+
+
+@lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def _compile_language(language):
+    """Compile the patterns for a language, once per language.
+    
+    Switching back to a language already used reuses its compiled tables.
+    
+    Args:
+        language: Lowercase programming language name
+        
+    Returns:
+        CompiledLanguage: The language's pattern tables
+    """
+    compiled_patterns = []
+    
+    # Get language-specific patterns
+    lang_patterns = LANGUAGE_PATTERNS.get(language, {})
+    
+    # Add language-specific patterns
+    for category_name, category_data in lang_patterns.items():
+        patterns = category_data.get('patterns', [])
+        speed_multiplier = category_data.get('speed_multiplier', 1.0)
+        pause_before = category_data.get('pause_before', 0)
+        pause_after = category_data.get('pause_after', 0)
+        
+        for pattern in patterns:
+            # Skip empty patterns
+            if not pattern:
+                continue
+                
+            # Alphanumeric patterns need word boundaries, symbols match exactly
+            compiled_patterns.append(PatternInfo(
+                word_boundary=pattern[0].isalnum(),
+                pattern=pattern,
+                speed_multiplier=speed_multiplier,
+                pause_before=pause_before,
+                pause_after=pause_after,
+                category=category_name
+            ))
+    
+    # Add operator patterns (language-agnostic)
+    for category_name, category_data in OPERATOR_PATTERNS.items():
+        patterns = category_data.get('patterns', [])
+        speed_multiplier = category_data.get('speed_multiplier', 1.0)
+        pause_before = category_data.get('pause_before', 0)
+        pause_after = category_data.get('pause_after', 0)
+        
+        for pattern in patterns:
+            compiled_patterns.append(PatternInfo(
+                word_boundary=False,
+                pattern=pattern,
+                speed_multiplier=speed_multiplier,
+                pause_before=pause_before,
+                pause_after=pause_after,
+                category=f'operator_{category_name}'
+            ))
+    
+    # Add punctuation patterns (language-agnostic)
+    for category_name, category_data in PUNCTUATION_PATTERNS.items():
+        patterns = category_data.get('patterns', [])
+        speed_multiplier = category_data.get('speed_multiplier', 1.0)
+        pause_before = category_data.get('pause_before', 0)
+        pause_after = category_data.get('pause_after', 0)
+        
+        for pattern in patterns:
+            compiled_patterns.append(PatternInfo(
+                word_boundary=False,
+                pattern=pattern,
+                speed_multiplier=speed_multiplier,
+                pause_before=pause_before,
+                pause_after=pause_after,
+                category=f'punctuation_{category_name}'
+            ))
+    
+    # Group symbol patterns first, then by first character, then sort by length
+    # (longest first) within each group to match longer patterns first
+    compiled_patterns.sort(key=lambda x: (x.word_boundary, x.pattern[0], -len(x.pattern)))
+    
+    combined_regex = re.compile(_combine_patterns(compiled_patterns))
+    
+    # Patterns are literals, so a pattern's match result is the same wherever
+    # it matches; build each one once instead of on every match
+    match_results = tuple(
+        MatchResult(
+            info.pattern,
+            info.pattern,
+            len(info.pattern),
+            info.speed_multiplier,
+            info.pause_before,
+            info.pause_after,
+            info.category
+        )
+        for info in compiled_patterns
+    )
+    
+    # Shared by every matcher for this language, so hand out immutable tables
+    return CompiledLanguage(tuple(compiled_patterns), match_results, combined_regex)
+
+
+def _combine_patterns(compiled_patterns):
+    """Build one alternation regex with a capture group per pattern, in order.
+    
+    The regex engine tries the alternatives in order, so the longest pattern
+    still wins. Word patterns all start with an alphanumeric character and
+    symbol patterns never do, so at most one of the two groups can match at a
+    position. That lets the word boundaries wrap the whole word group once
+    instead of being checked around every word pattern, and lets the cheaper
+    symbol group go first.
+    """
+    symbol_patterns = _bucket_by_first_char(
+        [info for info in compiled_patterns if not info.word_boundary]
+    )
+    word_patterns = _bucket_by_first_char(
+        [info for info in compiled_patterns if info.word_boundary]
+    )
+    alternatives = [symbol_patterns]
+    if word_patterns:
+        alternatives.append(r'\b(?:' + word_patterns + r')\b')
+    return '|'.join(alternatives)
+
+
+def _bucket_by_first_char(pattern_infos):
+    """Build an alternation that branches on the first character once.
+    
+    Patterns sharing a first character (already adjacent, longest first) become
+    one alternative that matches that character and then tries their rests,
+    e.g. p(?:(ublic)|(rivate)). The engine then rules out a whole bucket with a
+    single character check instead of trying every pattern in it.
+    """
+    return '|'.join(
+        re.escape(first_char)
+        + '(?:' + '|'.join(f"({re.escape(info.pattern[1:])})" for info in bucket) + ')'
+        for first_char, bucket in groupby(pattern_infos, key=lambda info: info.pattern[0])
+    )
+
 
 class PatternMatcher:
     """Matches text patterns to determine appropriate typing behavior."""
@@ -20,79 +227,11 @@ class PatternMatcher:
         self._compile_patterns()
     
     def _compile_patterns(self):
-        """Compile patterns for the selected language."""
-        self.compiled_patterns = []
-        
-        # Get language-specific patterns
-        lang_patterns = LANGUAGE_PATTERNS.get(self.language, {})
-        
-        # Add language-specific patterns
-        for category_name, category_data in lang_patterns.items():
-            patterns = category_data.get('patterns', [])
-            speed_multiplier = category_data.get('speed_multiplier', 1.0)
-            pause_before = category_data.get('pause_before', 0)
-            pause_after = category_data.get('pause_after', 0)
-            
-            for pattern in patterns:
-                # Skip empty patterns
-                if not pattern:
-                    continue
-                    
-                # Escape special regex characters and create word boundary pattern
-                escaped_pattern = re.escape(pattern)
-                # Use word boundaries for alphanumeric patterns, exact match for symbols
-                if pattern[0].isalnum():
-                    regex_pattern = r'\b' + escaped_pattern + r'\b'
-                else:
-                    regex_pattern = escaped_pattern
-                
-                self.compiled_patterns.append({
-                    'regex': re.compile(regex_pattern),
-                    'pattern': pattern,
-                    'speed_multiplier': speed_multiplier,
-                    'pause_before': pause_before,
-                    'pause_after': pause_after,
-                    'category': category_name
-                })
-        
-        # Add operator patterns (language-agnostic)
-        for category_name, category_data in OPERATOR_PATTERNS.items():
-            patterns = category_data.get('patterns', [])
-            speed_multiplier = category_data.get('speed_multiplier', 1.0)
-            pause_before = category_data.get('pause_before', 0)
-            pause_after = category_data.get('pause_after', 0)
-            
-            for pattern in patterns:
-                escaped_pattern = re.escape(pattern)
-                self.compiled_patterns.append({
-                    'regex': re.compile(escaped_pattern),
-                    'pattern': pattern,
-                    'speed_multiplier': speed_multiplier,
-                    'pause_before': pause_before,
-                    'pause_after': pause_after,
-                    'category': f'operator_{category_name}'
-                })
-        
-        # Add punctuation patterns (language-agnostic)
-        for category_name, category_data in PUNCTUATION_PATTERNS.items():
-            patterns = category_data.get('patterns', [])
-            speed_multiplier = category_data.get('speed_multiplier', 1.0)
-            pause_before = category_data.get('pause_before', 0)
-            pause_after = category_data.get('pause_after', 0)
-            
-            for pattern in patterns:
-                escaped_pattern = re.escape(pattern)
-                self.compiled_patterns.append({
-                    'regex': re.compile(escaped_pattern),
-                    'pattern': pattern,
-                    'speed_multiplier': speed_multiplier,
-                    'pause_before': pause_before,
-                    'pause_after': pause_after,
-                    'category': f'punctuation_{category_name}'
-                })
-        
-        # Sort patterns by length (longest first) to match longer patterns first
-        self.compiled_patterns.sort(key=lambda x: len(x['pattern']), reverse=True)
+        """Load the compiled patterns for the selected language."""
+        compiled_language = _compile_language(self.language)
+        self.compiled_patterns = compiled_language.patterns
+        self.match_results = compiled_language.match_results
+        self.combined_regex = compiled_language.regex
     
     def find_pattern_at_position(self, text, position):
         """Find a matching pattern at the given position in text.
@@ -102,28 +241,46 @@ class PatternMatcher:
             position: Current character position in the text
             
         Returns:
-            dict: Pattern info with speed_multiplier, pause_before, pause_after, and length
-                  or None if no pattern matches
+            MatchResult: Matched pattern with speed_multiplier, pause_before, pause_after,
+                         and length, or None if no pattern matches
         """
-        # Try to match each compiled pattern at this position
-        for pattern_info in self.compiled_patterns:
-            match = pattern_info['regex'].match(text, position)
-            if match:
-                matched_text = match.group(0)
-                return {
-                    'pattern': pattern_info['pattern'],
-                    'matched_text': matched_text,
-                    'length': len(matched_text),
-                    'speed_multiplier': pattern_info['speed_multiplier'],
-                    'pause_before': pattern_info['pause_before'],
-                    'pause_after': pattern_info['pause_after'],
-                    'category': pattern_info['category']
-                }
-        
-        return None
+        match = self.combined_regex.match(text, position)
+        if not match:
+            return None
+
+        return self._match_result(match)
+
+    def precompute_pattern_map(self, text, start=0, end=None):
+        """Find the patterns that typing from start would hit, in a single pass.
+
+        Scanning with finditer visits positions exactly like the typing loop does:
+        a match consumes the whole pattern, otherwise the scan moves on by one
+        character. Pause directives are not known here, so callers should map
+        each directive-free segment separately.
+
+        Args:
+            text: The full text string
+            start: Position the typing starts from (default: 0)
+            end: Position the scan stops at (default: end of text)
+
+        Returns:
+            dict: MatchResult (as returned by find_pattern_at_position) keyed by
+                  the position the pattern starts at
+        """
+        if end is None:
+            end = len(text)
+        return {
+            match.start(): self._match_result(match)
+            for match in self.combined_regex.finditer(text, start, end)
+        }
+
+    def _match_result(self, match):
+        """Look up the MatchResult for a match of the combined regex."""
+        # Each pattern is wrapped in exactly one group, so lastindex identifies it
+        return self.match_results[match.lastindex - 1]
     
     def set_language(self, language):
-        """Change the language and recompile patterns.
+        """Switch to another language's cached pattern tables, compiling them on first use.
         
         Args:
             language: Programming language name
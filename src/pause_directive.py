@@ -14,18 +14,33 @@ Examples:
 import re
 import logging
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterator
 
 # Constants
 PAUSE_DIRECTIVE_PATTERN = r'\{\{PAUSE:(\d+(?:\.\d+)?)\}\}'
+PAUSE_DIRECTIVE_PREFIX = '{{PAUSE:'  # Every directive starts with this; checked before the regex
 MIN_PAUSE_DURATION = 0.0
 MAX_PAUSE_DURATION = 60.0  # Maximum 60 seconds to prevent accidental long pauses
 DEFAULT_PAUSE_DURATION = 1.0
 
+# Compiled once and shared by every parser and has_pause_directives()
+_PAUSE_DIRECTIVE_RE = re.compile(PAUSE_DIRECTIVE_PATTERN)
+
 # Module logger
 logger = logging.getLogger(__name__)
 
 
+def _iter_directive_matches(text: str) -> Iterator[re.Match]:
+    """Iterate over the pause directive matches in text, in order.
+    
+    Most text has no directives, so the regex scan only runs when the
+    directive prefix appears somewhere in the text.
+    """
+    if PAUSE_DIRECTIVE_PREFIX not in text:
+        return iter(())
+    return _PAUSE_DIRECTIVE_RE.finditer(text)
+
+
 @dataclass
 class PauseDirective:
     """Represents a pause directive found in text.
@@ -36,6 +51,9 @@ class PauseDirective:
         duration: Pause duration in seconds
         raw_text: The original directive text (e.g., "{{PAUSE:2}}")
     """
+    
+    __slots__ = ('start_position', 'end_position', 'duration', 'raw_text')
+    
     start_position: int
     end_position: int
     duration: float
@@ -68,7 +86,7 @@ class PauseDirectiveParser:
         """
         self.min_duration = min_duration
         self.max_duration = max_duration
-        self.pattern = re.compile(PAUSE_DIRECTIVE_PATTERN)
+        self.pattern = _PAUSE_DIRECTIVE_RE
     
     def find_all_directives(self, text: str) -> List[PauseDirective]:
         """Find all pause directives in the given text.
@@ -80,26 +98,31 @@ class PauseDirectiveParser:
             List of PauseDirective objects, ordered by position
         """
         directives = []
-        
-        for match in self.pattern.finditer(text):
-            raw_duration = float(match.group(1))
-            validated_duration = self.validate_duration(raw_duration)
-            
-            directive = PauseDirective(
-                start_position=match.start(),
-                end_position=match.end(),
-                duration=validated_duration,
-                raw_text=match.group(0)
-            )
+        for match in _iter_directive_matches(text):
+            directive = self._build_directive(match)
             directives.append(directive)
             
             logger.debug(
-                f"Found pause directive at position {directive.start_position}: "
-                f"'{directive.raw_text}' -> {directive.duration}s"
+                "Found pause directive at position %d: '%s' -> %ss",
+                directive.start_position, directive.raw_text, directive.duration
             )
         
         return directives
     
+    def prescan(self, text: str) -> Dict[int, PauseDirective]:
+        """Find all pause directives in one sweep, keyed by start position.
+        
+        Lets callers walking through the text look up a directive at each
+        position without running the regex there.
+        
+        Args:
+            text: The text to search for pause directives
+            
+        Returns:
+            Dict mapping start position to PauseDirective, ordered by position
+        """
+        return {directive.start_position: directive for directive in self.find_all_directives(text)}
+    
     def find_directive_at_position(self, text: str, position: int) -> Optional[PauseDirective]:
         """Check if there's a pause directive starting at the given position.
         
@@ -110,22 +133,34 @@ class PauseDirectiveParser:
         Returns:
             PauseDirective if one starts at this position, None otherwise
         """
+        # Most positions can't start a directive, so rule them out without the regex
+        if not text.startswith(PAUSE_DIRECTIVE_PREFIX, position):
+            return None
+        
         # Try to match the pattern starting at the given position
         match = self.pattern.match(text, position)
         
         if match:
-            raw_duration = float(match.group(1))
-            validated_duration = self.validate_duration(raw_duration)
-            
-            return PauseDirective(
-                start_position=match.start(),
-                end_position=match.end(),
-                duration=validated_duration,
-                raw_text=match.group(0)
-            )
+            return self._build_directive(match)
         
         return None
     
+    def _build_directive(self, match: re.Match) -> PauseDirective:
+        """Build a PauseDirective from a match of the directive pattern."""
+        return PauseDirective(
+            start_position=match.start(),
+            end_position=match.end(),
+            duration=self._parse_duration(match),
+            raw_text=match[0]
+        )
+    
+    def _parse_duration(self, match: re.Match) -> float:
+        """Read the validated duration from a match of the directive pattern."""
+        duration = float(match[1])
+        if not self.min_duration <= duration <= self.max_duration:
+            duration = self.validate_duration(duration)  # Clamps and warns
+        return duration
+    
     def validate_duration(self, duration: float) -> float:
         """Validate and clamp duration to acceptable range.
         
@@ -174,8 +209,9 @@ class PauseDirectiveParser:
         Returns:
             Total pause time in seconds
         """
-        directives = self.find_all_directives(text)
-        return sum(d.duration for d in directives)
+        # Only the durations are needed, so don't build PauseDirective objects
+        parse_duration = self._parse_duration
+        return sum(parse_duration(match) for match in _iter_directive_matches(text))
     
     def get_directive_count(self, text: str) -> int:
         """Count the number of pause directives in text.
@@ -186,7 +222,7 @@ class PauseDirectiveParser:
         Returns:
             Number of pause directives found
         """
-        return len(self.pattern.findall(text))
+        return sum(1 for _ in _iter_directive_matches(text))
 
 
 # Convenience function for quick checks
@@ -199,5 +235,4 @@ def has_pause_directives(text: str) -> bool:
     Returns:
         True if text contains at least one pause directive
     """
-    pattern = re.compile(PAUSE_DIRECTIVE_PATTERN)
-    return bool(pattern.search(text))
+    return next(_iter_directive_matches(text), None) is not None
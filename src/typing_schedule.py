@@ -0,0 +1,228 @@
+"""
+Typing Schedule Module
+Plans every keystroke and delay for a text before typing starts.
+
+The schedule folds pattern speed multipliers, pattern pauses, pause directives
+and leading whitespace skipping into a flat list of steps, so the typing worker
+only has to type each step's text and wait for its delay with sleep_until().
+"""
+
+import re
+import time
+import random
+import logging
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Constants
+CHARS_PER_WORD = 5  # Standard typing test assumption
+SECONDS_PER_CHAR_AT_1_WPM = 60 / CHARS_PER_WORD  # Divide by the WPM for the delay per character
+LEADING_WHITESPACE_PATTERN = re.compile(r'^[ \t]+', re.MULTILINE)
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TypingStep:
+    """A chunk of text to type followed by a delay.
+    
+    Attributes:
+        text: Characters to type (empty for a pure pause)
+        delay: Seconds to wait after typing the text
+        end_position: Position in the source text once this step is done
+    """
+    text: str
+    delay: float
+    end_position: int
+
+
+def build_schedule(text: str, start: int, pattern_matcher, pause_parser,
+                   min_wpm: float, max_wpm: float,
+                   ignore_leading_whitespace: bool = False,
+                   batch_patterns: bool = False,
+                   rng: Optional[random.Random] = None) -> List[TypingStep]:
+    """Plan the typing of text from the given start position.
+    
+    Args:
+        text: The full text to type
+        start: Position to start (or resume) typing from
+        pattern_matcher: PatternMatcher for the selected language
+        pause_parser: PauseDirectiveParser for {{PAUSE:X}} directives
+        min_wpm: Minimum typing speed in words per minute
+        max_wpm: Maximum typing speed in words per minute
+        ignore_leading_whitespace: Whether to skip whitespace at line starts
+        batch_patterns: Whether to type each pattern and each run of plain characters
+            in one keystroke batch, keeping its total duration but not the
+            per-character cadence
+        rng: Random generator for typing speed jitter (default: shared module generator)
+    
+    Returns:
+        List of TypingStep objects, in typing order
+    """
+    schedule = []
+    draw_wpm = (rng or random).uniform  # Bound once, drawn once per pattern or run
+    directives = pause_parser.prescan(text)
+    pattern_map = build_pattern_map(text, start, pattern_matcher, directives)
+    # Leading whitespace is only ever skipped from a line start, so the table
+    # keyed by line start also tells us where we're at line start
+    leading_whitespace_ends = find_leading_whitespace_ends(text) if ignore_leading_whitespace else {}
+    position = start
+    
+    # Bind the lookups made at every step to locals
+    add_step = schedule.append
+    get_directive = directives.get
+    get_pattern = pattern_map.get
+    text_length = len(text)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)  # Checked once, not per pattern
+    pattern_count = 0
+    directive_count = 0
+    directive_pause_time = 0.0
+    
+    while position < text_length:
+        # Check for pause directive at current position (highest priority)
+        pause_directive = get_directive(position)
+        if pause_directive:
+            if debug_enabled:
+                logger.debug("Pause directive: %ss at position %d", pause_directive.duration, position)
+            add_step(TypingStep('', pause_directive.duration, pause_directive.end_position))
+            directive_count += 1
+            directive_pause_time += pause_directive.duration
+            position = pause_directive.end_position  # Skip past the directive
+            continue
+        
+        # Check if we should skip leading whitespace
+        if position in leading_whitespace_ends:
+            position = leading_whitespace_ends[position]
+            continue
+        
+        # Check if we're at the start of a known pattern
+        pattern_info = get_pattern(position)
+        
+        if pattern_info:
+            # Found a pattern - apply pause before if needed
+            pattern_count += 1
+            if pattern_info.pause_before > 0:
+                add_step(TypingStep('', pattern_info.pause_before, position))
+            
+            adjusted_delay = SECONDS_PER_CHAR_AT_1_WPM / (
+                draw_wpm(min_wpm, max_wpm) * pattern_info.speed_multiplier
+            )
+            
+            if debug_enabled:
+                logger.debug("Pattern '%s' (category: %s) with speed_multiplier=%.2f, delay=%.4fs per char",
+                             pattern_info.matched_text, pattern_info.category,
+                             pattern_info.speed_multiplier, adjusted_delay)
+            
+            # Type the pattern character by character; the last character is
+            # followed by the pattern's pause after instead of the char delay
+            pattern_end = position + pattern_info.length
+            if batch_patterns:
+                pattern_delay = adjusted_delay * (pattern_info.length - 1) + pattern_info.pause_after
+                add_step(TypingStep(pattern_info.matched_text, pattern_delay, pattern_end))
+            else:
+                for char_position in range(position, pattern_end - 1):
+                    add_step(TypingStep(text[char_position], adjusted_delay, char_position + 1))
+                add_step(TypingStep(text[pattern_end - 1], pattern_info.pause_after, pattern_end))
+            
+            position = pattern_end
+        elif batch_patterns:
+            # No pattern match - type the whole run of plain characters at default speed
+            run_end = find_plain_run_end(text, position, pattern_map, directives)
+            
+            # WPM delay: Convert WPM to delay per character, applied once for the run
+            delay = SECONDS_PER_CHAR_AT_1_WPM / draw_wpm(min_wpm, max_wpm)
+            add_step(TypingStep(text[position:run_end], delay * (run_end - position), run_end))
+            position = run_end
+        else:
+            # No pattern match - type the character at default speed
+            delay = SECONDS_PER_CHAR_AT_1_WPM / draw_wpm(min_wpm, max_wpm)
+            add_step(TypingStep(text[position], delay, position + 1))
+            position += 1
+    
+    # Per-pattern and per-directive details are logged at DEBUG level; the
+    # summary keeps a record of what this plan applied in the INFO log
+    logger.info("Planned %d steps: %d patterns, %d pause directives (%.2fs of pauses)",
+                len(schedule), pattern_count, directive_count, directive_pause_time)
+    return schedule
+
+
+def find_leading_whitespace_ends(text: str) -> dict:
+    """Map each line start that begins with spaces or tabs to the first character after them.
+    
+    Args:
+        text: The full text to type
+    
+    Returns:
+        dict: End of the leading whitespace keyed by the line start position
+    """
+    return {match.start(): match.end() for match in LEADING_WHITESPACE_PATTERN.finditer(text)}
+
+
+def build_pattern_map(text: str, start: int, pattern_matcher, directives: dict) -> dict:
+    """Map the patterns typed from start, scanning each directive-free segment once.
+    
+    Args:
+        text: The full text to type
+        start: Position typing starts from
+        pattern_matcher: PatternMatcher for the selected language
+        directives: Pause directives keyed by start position, in order
+    
+    Returns:
+        dict: Pattern info keyed by the position the pattern starts at
+    """
+    pattern_map = {}
+    segment_start = start
+    for directive in directives.values():
+        if directive.start_position < start:
+            continue
+        pattern_map.update(
+            pattern_matcher.precompute_pattern_map(text, segment_start, directive.start_position)
+        )
+        segment_start = directive.end_position
+    pattern_map.update(pattern_matcher.precompute_pattern_map(text, segment_start))
+    return pattern_map
+
+
+def find_plain_run_end(text: str, position: int, pattern_map: dict, directives: dict) -> int:
+    """Find the end of the run of plain characters starting at position.
+    
+    A run stops after a newline, or before a pause directive or known pattern,
+    so those keep their own timing and leading whitespace handling still applies.
+    
+    Args:
+        text: The full text to type
+        position: Position of the first character of the run
+        pattern_map: Pattern info keyed by start position
+        directives: Pause directives keyed by start position
+    
+    Returns:
+        Position just past the end of the run
+    """
+    end = position + 1
+    while end < len(text) and text[end - 1] != '\n':
+        if end in pattern_map or end in directives:
+            break
+        end += 1
+    return end
+
+
+def sleep_until(deadline: float, halt_event: threading.Event) -> Optional[float]:
+    """Sleep until the given time.perf_counter() deadline, or until halt_event is set.
+    
+    Args:
+        deadline: time.perf_counter() value to sleep until
+        halt_event: Event that ends the sleep early when set (pause or stop)
+    
+    Returns:
+        The deadline, or the current time if it had already passed, so a late
+        keystroke pushes back the following ones instead of making them burst out.
+        None if halt_event was set while sleeping.
+    """
+    now = time.perf_counter()
+    if now >= deadline:
+        return now
+    if halt_event.wait(deadline - now):
+        return None
+    return deadline
@@ -14,23 +14,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 class TestPlatformDetection(unittest.TestCase):
     """Tests for platform detection."""
     
-    def test_darwin_detected(self):
-        """Test macOS detection."""
-        with patch('platform.system', return_value='Darwin'):
-            import platform
-            self.assertEqual(platform.system(), 'Darwin')
-    
-    def test_linux_detected(self):
-        """Test Linux detection."""
-        with patch('platform.system', return_value='Linux'):
-            import platform
-            self.assertEqual(platform.system(), 'Linux')
-    
-    def test_windows_detected(self):
-        """Test Windows detection."""
-        with patch('platform.system', return_value='Windows'):
-            import platform
-            self.assertEqual(platform.system(), 'Windows')
+    @patch('platform.system')
+    def test_system_detected(self, mock_system):
+        """Test macOS, Linux and Windows detection."""
+        import platform
+        for system in ('Darwin', 'Linux', 'Windows'):
+            with self.subTest(system=system):
+                mock_system.return_value = system
+                self.assertEqual(platform.system(), system)
 
 
 class TestHelpMessageContent(unittest.TestCase):
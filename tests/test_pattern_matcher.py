@@ -15,14 +15,15 @@ from pattern_matcher import PatternMatcher
 class TestPatternDetection(unittest.TestCase):
     """Tests for pattern detection in code."""
     
-    def setUp(self):
-        self.matcher = PatternMatcher('java')
+    @classmethod
+    def setUpClass(cls):
+        cls.matcher = PatternMatcher('java')  # Only read from, so shared by the class
     
     def test_detects_public_keyword(self):
         """Test detection of 'public' keyword."""
         result = self.matcher.find_pattern_at_position("public class Test", 0)
         self.assertIsNotNone(result)
-        self.assertEqual(result['matched_text'], 'public')
+        self.assertEqual(result.matched_text, 'public')
     
     def test_detects_static_keyword(self):
         """Test detection of 'static' keyword."""
@@ -30,19 +31,19 @@ class TestPatternDetection(unittest.TestCase):
         pos = text.index('static')
         result = self.matcher.find_pattern_at_position(text, pos)
         self.assertIsNotNone(result)
-        self.assertEqual(result['matched_text'], 'static')
+        self.assertEqual(result.matched_text, 'static')
     
     def test_detects_boilerplate_pattern(self):
         """Test detection of boilerplate like System.out.println."""
         result = self.matcher.find_pattern_at_position("System.out.println(\"test\");", 0)
         self.assertIsNotNone(result)
-        self.assertEqual(result['matched_text'], 'System.out.println')
+        self.assertEqual(result.matched_text, 'System.out.println')
     
     def test_detects_annotation(self):
         """Test detection of @Override annotation."""
         result = self.matcher.find_pattern_at_position("@Override", 0)
         self.assertIsNotNone(result)
-        self.assertEqual(result['matched_text'], '@Override')
+        self.assertEqual(result.matched_text, '@Override')
     
     def test_no_pattern_for_variable_name(self):
         """Test that custom variable names don't match patterns."""
@@ -53,8 +54,44 @@ class TestPatternDetection(unittest.TestCase):
         """Test that detected patterns have speed multiplier."""
         result = self.matcher.find_pattern_at_position("public", 0)
         self.assertIsNotNone(result)
-        self.assertIn('speed_multiplier', result)
-        self.assertGreater(result['speed_multiplier'], 1.0)
+        self.assertTrue(hasattr(result, 'speed_multiplier'))
+        self.assertGreater(result.speed_multiplier, 1.0)
+
+
+class TestPatternMap(unittest.TestCase):
+    """Tests for precomputing pattern positions in one pass."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.matcher = PatternMatcher('java')
+    
+    def test_map_matches_position_by_position_scan(self):
+        """Test the map has the patterns a position-by-position scan would find."""
+        text = "public static void main(String[] args) {\n    System.out.println(x == 5);\n}"
+        expected = {}
+        position = 0
+        while position < len(text):
+            result = self.matcher.find_pattern_at_position(text, position)
+            if result:
+                expected[position] = result
+                position += result.length
+            else:
+                position += 1
+        
+        self.assertEqual(self.matcher.precompute_pattern_map(text), expected)
+    
+    def test_map_respects_start_and_end(self):
+        """Test the scan is limited to the given range."""
+        text = "public class Test"
+        pattern_map = self.matcher.precompute_pattern_map(text, 7, 12)
+        
+        self.assertEqual(list(pattern_map), [7])
+        self.assertEqual(pattern_map[7].matched_text, 'class')
+    
+    def test_repeated_pattern_shares_match_result(self):
+        """Test the same pattern at different positions reuses one match result."""
+        pattern_map = self.matcher.precompute_pattern_map("public x; public y;")
+        self.assertIs(pattern_map[0], pattern_map[10])
 
 
 class TestLanguageSwitching(unittest.TestCase):
@@ -70,7 +107,7 @@ class TestLanguageSwitching(unittest.TestCase):
         
         result = self.matcher.find_pattern_at_position("const x = 5", 0)
         self.assertIsNotNone(result)
-        self.assertEqual(result['matched_text'], 'const')
+        self.assertEqual(result.matched_text, 'const')
     
     def test_switch_back_to_java(self):
         """Test switching back to Java mode."""
@@ -79,7 +116,15 @@ class TestLanguageSwitching(unittest.TestCase):
         
         result = self.matcher.find_pattern_at_position("public class", 0)
         self.assertIsNotNone(result)
-        self.assertEqual(result['matched_text'], 'public')
+        self.assertEqual(result.matched_text, 'public')
+    
+    def test_switch_reuses_compiled_patterns(self):
+        """Test that switching back to a language reuses its compiled regex."""
+        java_regex = self.matcher.combined_regex
+        self.matcher.set_language('javascript')
+        self.matcher.set_language('java')
+        
+        self.assertIs(self.matcher.combined_regex, java_regex)
     
     def test_java_specific_pattern(self):
         """Test Java-specific pattern detection."""
@@ -90,14 +135,15 @@ class TestLanguageSwitching(unittest.TestCase):
 class TestSpeedMultipliers(unittest.TestCase):
     """Tests for speed multiplier values."""
     
-    def setUp(self):
-        self.matcher = PatternMatcher('java')
+    @classmethod
+    def setUpClass(cls):
+        cls.matcher = PatternMatcher('java')
     
     def test_keyword_speed_multiplier(self):
         """Test that keywords have appropriate speed multiplier."""
         result = self.matcher.find_pattern_at_position("public", 0)
         self.assertIsNotNone(result)
-        self.assertGreaterEqual(result['speed_multiplier'], 1.5)
+        self.assertGreaterEqual(result.speed_multiplier, 1.5)
     
     def test_boilerplate_faster_than_keyword(self):
         """Test that boilerplate is typed faster than keywords."""
@@ -106,7 +152,7 @@ class TestSpeedMultipliers(unittest.TestCase):
         
         self.assertIsNotNone(keyword)
         self.assertIsNotNone(boilerplate)
-        self.assertGreaterEqual(boilerplate['speed_multiplier'], keyword['speed_multiplier'])
+        self.assertGreaterEqual(boilerplate.speed_multiplier, keyword.speed_multiplier)
 
 
 if __name__ == '__main__':
@@ -28,6 +28,15 @@ from pause_directive import (
 )
 
 
+class ParserTestMixin:
+    """Gives each test class one parser, shared by its tests since they only read from it."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.parser = PauseDirectiveParser()
+
+
 class TestPauseDirective(unittest.TestCase):
     """Tests for the PauseDirective dataclass."""
     
@@ -65,13 +74,9 @@ class TestPauseDirective(unittest.TestCase):
         self.assertEqual(directive.length, 14)
 
 
-class TestPauseDirectiveParserFindAll(unittest.TestCase):
+class TestPauseDirectiveParserFindAll(ParserTestMixin, unittest.TestCase):
     """Tests for PauseDirectiveParser.find_all_directives()."""
     
-    def setUp(self):
-        """Set up parser instance for tests."""
-        self.parser = PauseDirectiveParser()
-    
     def test_find_single_directive(self):
         """Test finding a single pause directive."""
         text = "Hello {{PAUSE:2}} World"
@@ -131,12 +136,9 @@ class TestPauseDirectiveParserFindAll(unittest.TestCase):
         self.assertEqual(len(directives), 0)
 
 
-class TestPauseDirectiveParserDecimalDurations(unittest.TestCase):
+class TestPauseDirectiveParserDecimalDurations(ParserTestMixin, unittest.TestCase):
     """Tests for decimal duration parsing."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_decimal_duration_single_digit(self):
         """Test parsing single decimal digit."""
         text = "{{PAUSE:0.5}}"
@@ -178,12 +180,9 @@ class TestPauseDirectiveParserDecimalDurations(unittest.TestCase):
         self.assertEqual(directives[0].duration, 0.0)
 
 
-class TestPauseDirectiveParserValidation(unittest.TestCase):
+class TestPauseDirectiveParserValidation(ParserTestMixin, unittest.TestCase):
     """Tests for duration validation and clamping."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_duration_below_minimum_clamped(self):
         """Test that durations below minimum are clamped."""
         # Note: regex only matches positive numbers, so we test validate_duration directly
@@ -229,102 +228,44 @@ class TestPauseDirectiveParserValidation(unittest.TestCase):
         self.assertEqual(directives2[0].duration, 5.0)
 
 
-class TestPauseDirectiveParserInvalidFormats(unittest.TestCase):
+class TestPauseDirectiveParserInvalidFormats(ParserTestMixin, unittest.TestCase):
     """Tests for handling invalid/malformed directives."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
-    def test_invalid_non_numeric_duration(self):
-        """Test that non-numeric durations are not matched."""
-        text = "{{PAUSE:abc}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_empty_duration(self):
-        """Test that empty duration is not matched."""
-        text = "{{PAUSE:}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_missing_duration(self):
-        """Test that missing duration is not matched."""
-        text = "{{PAUSE}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_single_braces(self):
-        """Test that single braces are not matched."""
-        text = "{PAUSE:2}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_wrong_keyword(self):
-        """Test that wrong keyword is not matched."""
-        text = "{{WAIT:2}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_lowercase(self):
-        """Test that lowercase PAUSE is not matched."""
-        text = "{{pause:2}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_extra_spaces(self):
-        """Test that extra spaces break the match."""
-        text = "{{ PAUSE:2 }}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_negative_number_format(self):
-        """Test that negative numbers are not matched (regex doesn't allow -)."""
-        text = "{{PAUSE:-5}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_invalid_multiple_decimals(self):
-        """Test that multiple decimal points are not matched."""
-        text = "{{PAUSE:1.2.3}}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
+    INVALID_DIRECTIVES = [
+        ("{{PAUSE:abc}}", "non-numeric duration"),
+        ("{{PAUSE:}}", "empty duration"),
+        ("{{PAUSE}}", "missing duration"),
+        ("{PAUSE:2}", "single braces"),
+        ("{{WAIT:2}}", "wrong keyword"),
+        ("{{pause:2}}", "lowercase keyword"),
+        ("{{ PAUSE:2 }}", "extra spaces"),
+        ("{{PAUSE:-5}}", "negative number (regex doesn't allow -)"),
+        ("{{PAUSE:1.2.3}}", "multiple decimal points"),
+    ]
+    
+    def test_invalid_formats_not_matched(self):
+        """Test that malformed directives are not matched."""
+        for text, reason in self.INVALID_DIRECTIVES:
+            with self.subTest(reason, text=text):
+                self.assertEqual(self.parser.find_all_directives(text), [])
 
 
-class TestPauseDirectiveParserJavaCodeCompatibility(unittest.TestCase):
+class TestPauseDirectiveParserJavaCodeCompatibility(ParserTestMixin, unittest.TestCase):
     """Tests to ensure no conflicts with Java code syntax."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
-    def test_no_match_java_generics(self):
-        """Test that Java generics are not matched."""
-        text = "Map<String, List<Integer>> map = new HashMap<>();"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_no_match_java_array_init(self):
-        """Test that Java array initialization is not matched."""
-        text = "int[] arr = {1, 2, 3};"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
+    JAVA_SNIPPETS = [
+        ("Map<String, List<Integer>> map = new HashMap<>();", "generics"),
+        ("int[] arr = {1, 2, 3};", "array initialization"),
+        ("@Override\npublic void method() {}", "annotations"),
+        ("list.forEach(item -> { System.out.println(item); });", "lambda expressions"),
+        ('String template = "{name}";', "string templates"),
+    ]
     
-    def test_no_match_java_annotations(self):
-        """Test that Java annotations are not matched."""
-        text = "@Override\npublic void method() {}"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_no_match_java_lambda(self):
-        """Test that Java lambda expressions are not matched."""
-        text = "list.forEach(item -> { System.out.println(item); });"
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
-    
-    def test_no_match_java_string_template(self):
-        """Test that string templates are not matched."""
-        text = 'String template = "{name}";'
-        directives = self.parser.find_all_directives(text)
-        self.assertEqual(len(directives), 0)
+    def test_no_match_java_snippets(self):
+        """Test that Java syntax using braces and brackets is not matched."""
+        for text, syntax in self.JAVA_SNIPPETS:
+            with self.subTest(syntax, text=text):
+                self.assertEqual(self.parser.find_all_directives(text), [])
     
     def test_no_match_java_class_body(self):
         """Test that a full Java class is not matched."""
@@ -364,12 +305,9 @@ public static void main(String[] args) {
         self.assertEqual(directives[1].duration, 1.5)
 
 
-class TestPauseDirectiveParserFindAtPosition(unittest.TestCase):
+class TestPauseDirectiveParserFindAtPosition(ParserTestMixin, unittest.TestCase):
     """Tests for PauseDirectiveParser.find_directive_at_position()."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_find_at_exact_position(self):
         """Test finding directive at exact start position."""
         text = "Hi {{PAUSE:1}} there"
@@ -411,11 +349,33 @@ class TestPauseDirectiveParserFindAtPosition(unittest.TestCase):
         self.assertEqual(directive.duration, 2.0)
 
 
-class TestPauseDirectiveParserRemove(unittest.TestCase):
-    """Tests for PauseDirectiveParser.remove_all_directives()."""
+class TestPauseDirectiveParserPrescan(ParserTestMixin, unittest.TestCase):
+    """Tests for PauseDirectiveParser.prescan()."""
+    
+    def test_prescan_keyed_by_start_position(self):
+        """Test that directives are keyed by their start position."""
+        text = "{{PAUSE:1}} middle {{PAUSE:2}}"
+        directives = self.parser.prescan(text)
+        
+        self.assertEqual(list(directives), [0, 19])
+        self.assertEqual(directives[19].duration, 2.0)
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
+    def test_prescan_matches_find_at_position(self):
+        """Test that prescan agrees with find_directive_at_position everywhere."""
+        text = "a{{PAUSE:1}}{{PAUSE:0.5}} {{{PAUSE:2}} {{PAUSE:x}}"
+        directives = self.parser.prescan(text)
+        
+        for position in range(len(text)):
+            self.assertEqual(directives.get(position),
+                             self.parser.find_directive_at_position(text, position))
+    
+    def test_prescan_no_directives(self):
+        """Test that text without directives gives an empty table."""
+        self.assertEqual(self.parser.prescan("int x = 5;"), {})
+
+
+class TestPauseDirectiveParserRemove(ParserTestMixin, unittest.TestCase):
+    """Tests for PauseDirectiveParser.remove_all_directives()."""
     
     def test_remove_single_directive(self):
         """Test removing a single directive."""
@@ -448,18 +408,21 @@ class TestPauseDirectiveParserRemove(unittest.TestCase):
         self.assertEqual(result, "int[] arr = {1, 2};  Map<K,V> m;")
 
 
-class TestPauseDirectiveParserUtilities(unittest.TestCase):
+class TestPauseDirectiveParserUtilities(ParserTestMixin, unittest.TestCase):
     """Tests for utility methods."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_get_total_pause_time(self):
         """Test calculating total pause time."""
         text = "{{PAUSE:1}}{{PAUSE:2}}{{PAUSE:0.5}}"
         total = self.parser.get_total_pause_time(text)
         self.assertEqual(total, 3.5)
     
+    def test_get_total_pause_time_clamps_durations(self):
+        """Test total pause time uses the clamped durations."""
+        text = "{{PAUSE:1}}{{PAUSE:999}}"
+        total = self.parser.get_total_pause_time(text)
+        self.assertEqual(total, 1 + MAX_PAUSE_DURATION)
+    
     def test_get_total_pause_time_no_directives(self):
         """Test total pause time with no directives."""
         text = "No pauses"
@@ -492,14 +455,12 @@ class TestHasPauseDirectivesFunction(unittest.TestCase):
         self.assertFalse(has_pause_directives("No pauses here"))
         self.assertFalse(has_pause_directives(""))
         self.assertFalse(has_pause_directives("{PAUSE:1}"))  # Single braces
+        self.assertFalse(has_pause_directives("style={{color: 'red'}}"))  # JSX double braces
 
 
-class TestPauseDirectiveEdgeCases(unittest.TestCase):
+class TestPauseDirectiveEdgeCases(ParserTestMixin, unittest.TestCase):
     """Tests for edge cases and boundary conditions."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_very_long_duration_number(self):
         """Test very long duration number."""
         text = "{{PAUSE:99999999}}"
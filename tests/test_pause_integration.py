@@ -14,144 +14,62 @@ of the full auto-typing system, including:
 import sys
 import os
 import unittest
-from unittest.mock import Mock, patch, call
-import time
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from pause_directive import PauseDirectiveParser, PauseDirective
+from pattern_matcher import PatternMatcher
+from pause_directive import PauseDirectiveParser
+from typing_schedule import build_schedule
 
-
-class MockKeyboardController:
-    """Mock keyboard controller that records typed characters."""
-    
-    def __init__(self):
-        self.typed_chars = []
-    
-    def type(self, char):
-        """Record a typed character."""
-        self.typed_chars.append(char)
-    
-    def get_typed_text(self):
-        """Return all typed characters as a string."""
-        return ''.join(self.typed_chars)
-    
-    def reset(self):
-        """Clear recorded characters."""
-        self.typed_chars = []
+MIN_WPM = 100
+MAX_WPM = 250
 
 
-class MockTextWidget:
-    """Mock tkinter text widget for testing."""
-    
-    def __init__(self, text):
-        self.text = text
-    
-    def get(self, start, end):
-        """Return the text content."""
-        return self.text + '\n'  # Mimics tk.END behavior
+class ScheduleTestMixin:
+    """Plans text with the real typing schedule, as plan_typing does."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.parser = PauseDirectiveParser()
+        cls.matcher = PatternMatcher('java')
+    
+    def plan(self, text, start=0, ignore_leading_whitespace=False):
+        """Return the typing schedule for text from start."""
+        return build_schedule(text, start, self.matcher, self.parser,
+                              MIN_WPM, MAX_WPM, ignore_leading_whitespace)
+    
+    def typed_characters(self, text, start=0):
+        """Return (position, character) for every keystroke typed from start."""
+        return [(step.end_position - 1, step.text) for step in self.plan(text, start) if step.text]
+    
+    def typed_text(self, text, start=0, ignore_leading_whitespace=False):
+        """Return everything typed from start."""
+        return ''.join(step.text for step in self.plan(text, start, ignore_leading_whitespace))
 
 
-class TestPauseDirectiveNotTyped(unittest.TestCase):
+class TestPauseDirectiveNotTyped(ScheduleTestMixin, unittest.TestCase):
     """Tests verifying that pause directives are not typed."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
-    def test_single_pause_removed_from_output(self):
-        """Verify single pause directive is not in typed output."""
-        text = "Hello {{PAUSE:1}} World"
-        expected_output = "Hello  World"
-        
-        # Simulate what auto_type does: skip pause directives
-        output_chars = []
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), expected_output)
-    
-    def test_multiple_pauses_removed_from_output(self):
-        """Verify multiple pause directives are not in typed output."""
-        text = "A{{PAUSE:1}}B{{PAUSE:2}}C{{PAUSE:0.5}}D"
-        expected_output = "ABCD"
-        
-        output_chars = []
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), expected_output)
-    
-    def test_pause_at_start_removed(self):
-        """Verify pause directive at start is not typed."""
-        text = "{{PAUSE:1}}Hello"
-        expected_output = "Hello"
-        
-        output_chars = []
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), expected_output)
-    
-    def test_pause_at_end_removed(self):
-        """Verify pause directive at end is not typed."""
-        text = "Hello{{PAUSE:1}}"
-        expected_output = "Hello"
-        
-        output_chars = []
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), expected_output)
-    
-    def test_adjacent_pauses_removed(self):
-        """Verify adjacent pause directives are not typed."""
-        text = "X{{PAUSE:1}}{{PAUSE:2}}Y"
-        expected_output = "XY"
-        
-        output_chars = []
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), expected_output)
+    REMOVAL_CASES = [
+        ("Hello {{PAUSE:1}} World", "Hello  World", "single pause"),
+        ("A{{PAUSE:1}}B{{PAUSE:2}}C{{PAUSE:0.5}}D", "ABCD", "multiple pauses"),
+        ("{{PAUSE:1}}Hello", "Hello", "pause at start"),
+        ("Hello{{PAUSE:1}}", "Hello", "pause at end"),
+        ("X{{PAUSE:1}}{{PAUSE:2}}Y", "XY", "adjacent pauses"),
+    ]
+    
+    def test_pauses_removed_from_output(self):
+        """Verify pause directives are not in typed output."""
+        for text, expected_output, case in self.REMOVAL_CASES:
+            with self.subTest(case, text=text):
+                self.assertEqual(self.typed_text(text), expected_output)
 
 
-class TestPauseDirectiveWithJavaCode(unittest.TestCase):
+class TestPauseDirectiveWithJavaCode(ScheduleTestMixin, unittest.TestCase):
     """Tests for pause directives embedded in Java code."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_pause_in_java_method(self):
         """Test pause directive in Java method body."""
         java_code = """public static void main(String[] args) {
@@ -163,17 +81,9 @@ class TestPauseDirectiveWithJavaCode(unittest.TestCase):
     System.out.println("Hello");
 }"""
         
-        output_chars = []
-        position = 0
-        while position < len(java_code):
-            directive = self.parser.find_directive_at_position(java_code, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(java_code[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), expected_output)
+        output = self.typed_text(java_code)
+        
+        self.assertEqual(output, expected_output)
     
     def test_multiple_pauses_in_java_code(self):
         """Test multiple pause directives in Java code."""
@@ -200,25 +110,14 @@ class TestPauseDirectiveWithJavaCode(unittest.TestCase):
     int[] arr = {1, 2, 3};
 }"""
         
-        output_chars = []
-        position = 0
-        while position < len(java_code):
-            directive = self.parser.find_directive_at_position(java_code, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output_chars.append(java_code[position])
-            position += 1
-        
-        self.assertEqual(''.join(output_chars), java_code)
+        output = self.typed_text(java_code)
+        
+        self.assertEqual(output, java_code)
 
 
-class TestPauseDirectiveTiming(unittest.TestCase):
+class TestPauseDirectiveTiming(ScheduleTestMixin, unittest.TestCase):
     """Tests for pause directive timing behavior."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_pause_duration_extracted_correctly(self):
         """Test that pause durations are extracted correctly."""
         test_cases = [
@@ -241,70 +140,29 @@ class TestPauseDirectiveTiming(unittest.TestCase):
         total = self.parser.get_total_pause_time(text)
         self.assertEqual(total, 3.5)
     
-    def test_pause_timing_with_mock_sleep(self):
-        """Test that pause triggers sleep with correct duration."""
+    def scheduled_pauses(self, text):
+        """Return the pause steps the typing schedule plans for text."""
+        return [step.delay for step in self.plan(text) if not step.text]
+    
+    def test_pause_scheduled_with_correct_duration(self):
+        """Test that a pause directive is scheduled as a wait of its duration."""
         text = "Hello{{PAUSE:2}}World"
-        
-        sleep_calls = []
-        
-        def mock_sleep(duration):
-            sleep_calls.append(duration)
-        
-        # Simulate auto_type behavior
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                mock_sleep(directive.duration)
-                position = directive.end_position
-                continue
-            position += 1
-        
-        self.assertEqual(len(sleep_calls), 1)
-        self.assertEqual(sleep_calls[0], 2.0)
+        self.assertEqual(self.scheduled_pauses(text), [2.0])
     
     def test_multiple_pauses_timing(self):
         """Test timing with multiple pauses."""
         text = "{{PAUSE:1}}A{{PAUSE:0.5}}B{{PAUSE:2}}"
-        
-        sleep_calls = []
-        
-        def mock_sleep(duration):
-            sleep_calls.append(duration)
-        
-        position = 0
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                mock_sleep(directive.duration)
-                position = directive.end_position
-                continue
-            position += 1
-        
-        self.assertEqual(len(sleep_calls), 3)
-        self.assertEqual(sleep_calls, [1.0, 0.5, 2.0])
+        self.assertEqual(self.scheduled_pauses(text), [1.0, 0.5, 2.0])
 
 
-class TestPauseDirectivePositionTracking(unittest.TestCase):
+class TestPauseDirectivePositionTracking(ScheduleTestMixin, unittest.TestCase):
     """Tests for correct position tracking after pause directives."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_position_after_single_pause(self):
         """Test position is correct after single pause."""
         text = "AB{{PAUSE:1}}CD"
         
-        position = 0
-        chars_typed = []
-        
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            chars_typed.append((position, text[position]))
-            position += 1
+        chars_typed = self.typed_characters(text)
         
         # Should have typed A at 0, B at 1, C at 13, D at 14
         self.assertEqual(chars_typed[0], (0, 'A'))
@@ -316,87 +174,46 @@ class TestPauseDirectivePositionTracking(unittest.TestCase):
         """Test position tracking with newlines around pause."""
         text = "line1\n{{PAUSE:1}}\nline2"
         
-        position = 0
-        output = []
-        
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
+        output = self.typed_text(text)
         
-        self.assertEqual(''.join(output), "line1\n\nline2")
+        self.assertEqual(output, "line1\n\nline2")
 
 
-class TestPauseDirectiveWithPatternMatcher(unittest.TestCase):
+class TestPauseDirectiveWithPatternMatcher(ScheduleTestMixin, unittest.TestCase):
     """Tests for pause directive interaction with pattern matching."""
     
-    def setUp(self):
-        self.pause_parser = PauseDirectiveParser()
-    
     def test_pause_before_keyword(self):
         """Test pause directive before a Java keyword."""
         text = "{{PAUSE:1}}public class Test"
+        schedule = self.plan(text)
         
-        output = []
-        position = 0
-        pause_executed = False
-        
-        while position < len(text):
-            directive = self.pause_parser.find_directive_at_position(text, position)
-            if directive:
-                pause_executed = True
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
-        
-        self.assertTrue(pause_executed)
-        self.assertEqual(''.join(output), "public class Test")
+        self.assertEqual((schedule[0].text, schedule[0].delay), ('', 1.0))
+        self.assertEqual(''.join(step.text for step in schedule), "public class Test")
     
     def test_pause_after_keyword(self):
         """Test pause directive after a Java keyword."""
         text = "public{{PAUSE:1}} class Test"
+        keyword = self.matcher.find_pattern_at_position(text, 0)
+        schedule = self.plan(text)
         
-        output = []
-        position = 0
-        
-        while position < len(text):
-            directive = self.pause_parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output), "public class Test")
+        # The keyword keeps its own pause after, then the directive's pause follows
+        self.assertEqual(keyword.matched_text, "public")
+        self.assertEqual((schedule[5].text, schedule[5].delay), ('c', keyword.pause_after))
+        self.assertEqual((schedule[6].text, schedule[6].delay), ('', 1.0))
+        self.assertEqual(self.typed_text(text), "public class Test")
     
     def test_pause_between_keywords(self):
         """Test pause directive between Java keywords."""
         text = "public static{{PAUSE:2}} void main"
         
-        output = []
-        position = 0
+        output = self.typed_text(text)
         
-        while position < len(text):
-            directive = self.pause_parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output), "public static void main")
+        self.assertEqual(output, "public static void main")
 
 
-class TestPauseDirectiveResumeScenarios(unittest.TestCase):
+class TestPauseDirectiveResumeScenarios(ScheduleTestMixin, unittest.TestCase):
     """Tests for pause/resume scenarios with pause directives."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_resume_at_pause_directive(self):
         """Test resuming when position is at a pause directive."""
         text = "Hello{{PAUSE:1}}World"
@@ -404,18 +221,9 @@ class TestPauseDirectiveResumeScenarios(unittest.TestCase):
         # Simulate typing stopped at position 5 (just before pause)
         start_position = 5
         
-        output = []
-        position = start_position
+        output = self.typed_text(text, start_position)
         
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output), "World")
+        self.assertEqual(output, "World")
     
     def test_resume_after_pause_directive(self):
         """Test resuming when position is right after a pause directive."""
@@ -424,54 +232,21 @@ class TestPauseDirectiveResumeScenarios(unittest.TestCase):
         # Position 16 is right after the pause directive (at 'W')
         start_position = 16
         
-        output = []
-        position = start_position
-        
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
+        output = self.typed_text(text, start_position)
         
-        self.assertEqual(''.join(output), "World")
+        self.assertEqual(output, "World")
 
 
-class TestPauseDirectiveLineStartTracking(unittest.TestCase):
+class TestPauseDirectiveLineStartTracking(ScheduleTestMixin, unittest.TestCase):
     """Tests for line-start tracking with pause directives."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_pause_directive_at_line_start(self):
         """Test pause directive at the start of a line."""
         text = "line1\n{{PAUSE:1}}line2"
         
-        output = []
-        position = 0
-        at_line_start = True
-        
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                # After pause, check if at line start
-                if position > 0 and position < len(text):
-                    at_line_start = (text[position - 1] == '\n')
-                continue
-            
-            char = text[position]
-            output.append(char)
-            
-            if char == '\n':
-                at_line_start = True
-            elif char not in ' \t':
-                at_line_start = False
-            
-            position += 1
-        
-        self.assertEqual(''.join(output), "line1\nline2")
+        output = self.typed_text(text)
+        
+        self.assertEqual(output, "line1\nline2")
     
     def test_pause_between_newlines(self):
         """Test pause directive between newlines."""
@@ -483,65 +258,43 @@ class TestPauseDirectiveLineStartTracking(unittest.TestCase):
         
         cleaned = self.parser.remove_all_directives(text)
         self.assertEqual(cleaned, "line1\n\nline2")
+    
+    def test_indented_pause_with_leading_whitespace_skipped(self):
+        """Test that indentation before a pause directive is skipped when enabled."""
+        text = "line1\n    {{PAUSE:1}}line2\n\tline3"
+        
+        output = self.typed_text(text, ignore_leading_whitespace=True)
+        
+        self.assertEqual(output, "line1\nline2\nline3")
 
 
-class TestPauseDirectiveEdgeCasesIntegration(unittest.TestCase):
+class TestPauseDirectiveEdgeCasesIntegration(ScheduleTestMixin, unittest.TestCase):
     """Integration tests for edge cases."""
     
-    def setUp(self):
-        self.parser = PauseDirectiveParser()
-    
     def test_only_pause_directive(self):
         """Test text that is only a pause directive."""
         text = "{{PAUSE:1}}"
         
-        output = []
-        position = 0
-        
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
+        output = self.typed_text(text)
         
-        self.assertEqual(''.join(output), "")
+        self.assertEqual(output, "")
     
     def test_empty_text(self):
         """Test empty text."""
         text = ""
         
-        output = []
-        position = 0
+        output = self.typed_text(text)
         
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
-        
-        self.assertEqual(''.join(output), "")
+        self.assertEqual(output, "")
     
     def test_malformed_directive_typed_literally(self):
         """Test that malformed directives are typed literally."""
         text = "Hello {{PAUSE:abc}} World"
         
-        output = []
-        position = 0
-        
-        while position < len(text):
-            directive = self.parser.find_directive_at_position(text, position)
-            if directive:
-                position = directive.end_position
-                continue
-            output.append(text[position])
-            position += 1
+        output = self.typed_text(text)
         
         # Malformed directive should be typed as-is
-        self.assertEqual(''.join(output), "Hello {{PAUSE:abc}} World")
+        self.assertEqual(output, "Hello {{PAUSE:abc}} World")
     
     def test_very_long_pause_clamped(self):
         """Test that very long pause is clamped to maximum."""
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the typing schedule planner.
+"""
+
+import sys
+import os
+import random
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pattern_matcher import PatternMatcher
+from pause_directive import PauseDirectiveParser
+from typing_schedule import build_schedule, sleep_until, CHARS_PER_WORD
+
+MIN_WPM = 100
+MAX_WPM = 250
+
+
+def typed_text(schedule):
+    """Return everything the schedule would type."""
+    return ''.join(step.text for step in schedule)
+
+
+class TestScheduleOutput(unittest.TestCase):
+    """Tests for what the schedule types."""
+    
+    def setUp(self):
+        self.matcher = PatternMatcher('java')
+        self.parser = PauseDirectiveParser()
+    
+    def plan(self, text, start=0, ignore_leading_whitespace=False):
+        return build_schedule(text, start, self.matcher, self.parser,
+                              MIN_WPM, MAX_WPM, ignore_leading_whitespace)
+    
+    def test_types_text_unchanged(self):
+        """Test that plain code is typed exactly."""
+        text = "public class Test {\n    int x = 5;\n}"
+        self.assertEqual(typed_text(self.plan(text)), text)
+    
+    def test_pause_directive_not_typed(self):
+        """Test that pause directives become pauses instead of keystrokes."""
+        schedule = self.plan("Hello{{PAUSE:2}}World")
+        
+        self.assertEqual(typed_text(schedule), "HelloWorld")
+        pauses = [step for step in schedule if not step.text]
+        self.assertEqual(len(pauses), 1)
+        self.assertEqual(pauses[0].delay, 2.0)
+        self.assertEqual(pauses[0].end_position, 16)
+    
+    def test_skips_leading_whitespace(self):
+        """Test that leading whitespace is skipped when enabled."""
+        text = "public class Test {\n    int x = 5;\n\t}"
+        schedule = self.plan(text, ignore_leading_whitespace=True)
+        self.assertEqual(typed_text(schedule), "public class Test {\nint x = 5;\n}")
+    
+    def test_skips_mixed_and_whitespace_only_lines(self):
+        """Test that mixed tabs and spaces and whitespace-only lines are skipped."""
+        text = "a\n \t \n\t  b c\n  "
+        schedule = self.plan(text, ignore_leading_whitespace=True)
+        self.assertEqual(typed_text(schedule), "a\n\nb c\n")
+    
+    def test_resume_from_position(self):
+        """Test that planning from a position types only the rest of the text."""
+        text = "line1\n    line2"
+        schedule = self.plan(text, start=6, ignore_leading_whitespace=True)
+        self.assertEqual(typed_text(schedule), "line2")
+    
+    def test_end_positions_track_progress(self):
+        """Test that end positions increase and finish at the end of the text."""
+        text = "public static void main(String[] args) {{PAUSE:1}}{}"
+        schedule = self.plan(text)
+        positions = [step.end_position for step in schedule]
+        
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(positions[-1], len(text))
+    
+    def test_logs_plan_summary(self):
+        """Test that each plan logs its pattern and pause directive counts at INFO level."""
+        with self.assertLogs('typing_schedule', level='INFO') as logs:
+            schedule = self.plan("public{{PAUSE:1.5}} x{{PAUSE:0.5}}")
+        
+        self.assertEqual(logs.output, [
+            f"INFO:typing_schedule:Planned {len(schedule)} steps: 1 patterns, 2 pause directives (2.00s of pauses)"
+        ])
+
+
+class TestScheduleTiming(unittest.TestCase):
+    """Tests for the delays in the schedule."""
+    
+    def setUp(self):
+        self.matcher = PatternMatcher('java')
+        self.parser = PauseDirectiveParser()
+    
+    @patch('typing_schedule.random.uniform', return_value=MIN_WPM)
+    def test_pattern_and_plain_delays(self, mock_uniform):
+        """Test pattern characters use the speed multiplier and plain characters don't."""
+        schedule = build_schedule("public x", 0, self.matcher, self.parser, MIN_WPM, MAX_WPM)
+        base_delay = 60 / (MIN_WPM * CHARS_PER_WORD)
+        keyword = self.matcher.find_pattern_at_position("public", 0)
+        
+        self.assertEqual([step.text for step in schedule], list("public x"))
+        for step in schedule[:5]:
+            self.assertAlmostEqual(step.delay, base_delay / keyword.speed_multiplier)
+        self.assertEqual(schedule[5].delay, keyword.pause_after)
+        for step in schedule[6:]:
+            self.assertAlmostEqual(step.delay, base_delay)
+    
+    @patch('typing_schedule.random.uniform', return_value=MIN_WPM)
+    def test_batch_patterns_keep_total_delay(self, mock_uniform):
+        """Test batched patterns and plain runs are one step each with the same total delay."""
+        text = "public static x"
+        per_char = build_schedule(text, 0, self.matcher, self.parser, MIN_WPM, MAX_WPM)
+        batched = build_schedule(text, 0, self.matcher, self.parser, MIN_WPM, MAX_WPM,
+                                 batch_patterns=True)
+        
+        self.assertEqual([step.text for step in batched], ["public", " ", "static", " x"])
+        self.assertAlmostEqual(sum(step.delay for step in batched),
+                               sum(step.delay for step in per_char))
+    
+    def test_seeded_generator_is_reproducible(self):
+        """Test that the same seeded generator gives the same delays."""
+        text = "public static void main(String[] args) { int x = 5; }"
+        delays = [
+            [step.delay for step in build_schedule(text, 0, self.matcher, self.parser,
+                                                   MIN_WPM, MAX_WPM, rng=random.Random(42))]
+            for _ in range(2)
+        ]
+        self.assertEqual(delays[0], delays[1])
+
+
+
+@patch('typing_schedule.time.perf_counter', return_value=10.0)
+class TestSleepUntil(unittest.TestCase):
+    """Tests for waiting until a step's deadline."""
+    
+    def test_late_deadline_returns_now(self, mock_perf_counter):
+        """Test a passed deadline returns the current time without waiting."""
+        halt_event = Mock()
+        self.assertEqual(sleep_until(9.5, halt_event), 10.0)
+        halt_event.wait.assert_not_called()
+    
+    def test_waits_until_deadline(self, mock_perf_counter):
+        """Test a future deadline waits out the remaining time and returns the deadline."""
+        halt_event = Mock()
+        halt_event.wait.return_value = False
+        
+        self.assertEqual(sleep_until(10.25, halt_event), 10.25)
+        halt_event.wait.assert_called_once_with(0.25)
+    
+    def test_halt_event_returns_none(self, mock_perf_counter):
+        """Test a set halt event ends the wait and returns None."""
+        halt_event = threading.Event()
+        halt_event.set()
+        self.assertIsNone(sleep_until(60.0, halt_event))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
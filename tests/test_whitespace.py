@@ -9,10 +9,15 @@ import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from typing_schedule import LEADING_WHITESPACE_PATTERN
+
 
 def simulate_whitespace_skip(text, ignore_leading_whitespace):
     """Simulate the auto-type whitespace skipping logic.
     
+    Strips every line's leading spaces and tabs in one regex pass, using the
+    same pattern the typing schedule uses to find them.
+    
     Args:
         text: Text to process
         ignore_leading_whitespace: Whether to skip leading whitespace
@@ -20,22 +25,9 @@ def simulate_whitespace_skip(text, ignore_leading_whitespace):
     Returns:
         String that would actually be typed
     """
-    result = []
-    at_line_start = True
-    
-    for char in text:
-        if ignore_leading_whitespace and at_line_start and char in ' \t':
-            continue
-        
-        if char not in ' \t':
-            at_line_start = False
-        
-        result.append(char)
-        
-        if char == '\n':
-            at_line_start = True
-    
-    return ''.join(result)
+    if not ignore_leading_whitespace:
+        return text
+    return LEADING_WHITESPACE_PATTERN.sub('', text)
 
 
 class TestWhitespaceSkipping(unittest.TestCase):
@@ -96,10 +88,8 @@ class TestWhitespaceSkipping(unittest.TestCase):
 }"""
         result = simulate_whitespace_skip(text, True)
         
-        self.assertIn("void method()", result)
-        self.assertIn("int x = 5;", result)
-        self.assertNotIn("    void", result)
-        self.assertNotIn("        int", result)
+        self.assertEqual(result.splitlines(),
+                         ["public class Test {", "void method() {", "int x = 5;", "}", "}"])
 
 
 class TestWhitespaceResume(unittest.TestCase):
@@ -107,38 +97,17 @@ class TestWhitespaceResume(unittest.TestCase):
     
     def simulate_resume(self, text, ignore_whitespace, pause_pos):
         """Simulate resume from a position."""
-        result = []
-        
-        # First pass up to pause
-        at_line_start = True
-        for i in range(pause_pos):
-            char = text[i]
-            if ignore_whitespace and at_line_start and char in ' \t':
-                continue
-            if char not in ' \t':
-                at_line_start = False
-            result.append(char)
-            if char == '\n':
-                at_line_start = True
-        
-        # Resume: recalculate line start
-        if pause_pos > 0:
-            at_line_start = (text[pause_pos - 1] == '\n')
-        else:
-            at_line_start = True
-        
-        # Second pass from pause
-        for i in range(pause_pos, len(text)):
-            char = text[i]
-            if ignore_whitespace and at_line_start and char in ' \t':
-                continue
-            if char not in ' \t':
-                at_line_start = False
-            result.append(char)
-            if char == '\n':
-                at_line_start = True
-        
-        return ''.join(result)
+        # Up to the pause, typing behaves as if it had never stopped
+        typed = simulate_whitespace_skip(text[:pause_pos], ignore_whitespace)
+        
+        # Resume: only skip whitespace straight away if resuming at a line start
+        rest = text[pause_pos:]
+        if pause_pos > 0 and text[pause_pos - 1] != '\n':
+            first_line_end = rest.find('\n') + 1 or len(rest)
+            typed += rest[:first_line_end]
+            rest = rest[first_line_end:]
+        
+        return typed + simulate_whitespace_skip(rest, ignore_whitespace)
     
     def test_resume_mid_line(self):
         """Test resuming in middle of a line."""